@@ -21,7 +21,7 @@ __all__ = [
 
 #%% === Libraries ===
 import os
-from typing import Any
+from typing import Any, Iterator
 
 # Insternal
 from ..ops import ask, lprint
@@ -54,6 +54,7 @@ def global_variables() -> dict[str, Any]:
             tabular.SPREADSHEET_EXTENSIONS["csv"]
             + tabular.SPREADSHEET_EXTENSIONS["excel"]
         ),
+        "column_name_strip_table": str.maketrans("", "", " _-'\""),
         "column_aliases": {
             "source": "source",
             "destination": "destination",
@@ -69,6 +70,11 @@ def global_variables() -> dict[str, Any]:
 
 VAR = global_variables()
 TASK_KEYS = tuple(VAR["options"])
+OPTION_LOOKUP = {
+    **{str(index): task_key for index, task_key in enumerate(TASK_KEYS, start=1)},
+    **{description.lower(): task_key for task_key, description in VAR["options"].items()},
+    **{task_key: task_key for task_key in TASK_KEYS},
+}
 DirectoryPlan = dict[int, dict[str, str | None]]
 SpreadsheetTaskData = list[str] | list[list[str]] | DirectoryPlan
 
@@ -85,8 +91,7 @@ def _normalize_column_name(column_name: object) -> str:
     """
 
     normalized = str(column_name).strip().lower()
-    translation_table = str.maketrans("", "", " _-'\"")
-    return normalized.translate(translation_table)
+    return normalized.translate(VAR["column_name_strip_table"])
 
 
 def _normalize_cell_value(value: object) -> str | None:
@@ -100,6 +105,9 @@ def _normalize_cell_value(value: object) -> str | None:
         str | None: Cleaned string value, or ``None`` for blank cells.
     """
 
+    if isinstance(value, str):
+        return value.strip() or None
+
     if value is None:
         return None
 
@@ -110,29 +118,25 @@ def _normalize_cell_value(value: object) -> str | None:
     return cleaned_value or None
 
 
-def _load_sheet_records(spreadsheet_path: str) -> dict:
+def _iter_sheet_records(spreadsheet_path: str) -> Iterator[tuple[int, dict]]:
     """
-    Load spreadsheet data as row records keyed by row index.
+    Stream spreadsheet data rows together with their row index.
 
     Args:
         spreadsheet_path (str): Path to the spreadsheet file.
 
-    Returns:
-        dict: Spreadsheet rows converted into dictionaries.
+    Yields:
+        tuple[int, dict]: Zero-based data-row index and row dictionary.
     """
 
-    sheet_records = tabular.load_spreadsheet(
-        spreadsheet_path,
-        dtype="dict",
-        index_key=True,
-        index_1thcol=False,
-    )
+    row_count = 0
+    for row_index, row in enumerate(tabular.iter_spreadsheet_rows(spreadsheet_path)):
+        row_count += 1
+        yield row_index, row
 
-    if not sheet_records:
+    if not row_count:
         lprint.exit("The spreadsheet is empty.")
 
-    return sheet_records
-
 
 #%% === Spreadsheet Helpers ===
 
@@ -193,17 +197,11 @@ def determine_option(option: str | int | None) -> str:
 
     option_value = str(option).strip()
     if option_value.isdigit():
-        option_index = int(option_value) - 1
-        if 0 <= option_index < len(TASK_KEYS):
-            return TASK_KEYS[option_index]
-
-    if option_value in VAR["options"]:
-        return option_value
+        option_value = str(int(option_value))
 
-    option_value_lower = option_value.lower()
-    for task_key, description in VAR["options"].items():
-        if option_value_lower == description.lower():
-            return task_key
+    task_key = OPTION_LOOKUP.get(option_value) or OPTION_LOOKUP.get(option_value.lower())
+    if task_key is not None:
+        return task_key
 
     lprint.exit("Invalid option.")
     raise AssertionError("unreachable")
@@ -250,9 +248,8 @@ def get_sheet_data_dircolumns(spreadsheet_path: str) -> list[str]:
     """
 
     directory_list: list[str] = []
-    sheet_records = _load_sheet_records(spreadsheet_path)
 
-    for row in sheet_records.values():
+    for _, row in _iter_sheet_records(spreadsheet_path):
         row_values = [
             cell_value
             for value in row.values()
@@ -282,14 +279,25 @@ def get_sheet_data_sourcedestination(spreadsheet_path: str) -> DirectoryPlan:
     """
 
     directory_plan: DirectoryPlan = {}
-    sheet_records = _load_sheet_records(spreadsheet_path)
+    canonical_names: dict[object, str | None] | None = None
+
+    for row_index, row in _iter_sheet_records(spreadsheet_path):
+        if canonical_names is None:
+            # Every streamed row carries all header labels, so resolve them once.
+            # Later .xlsx rows may add Unnamed labels, which never name a plan column.
+            canonical_names = {
+                column_name: VAR["column_aliases"].get(_normalize_column_name(column_name))
+                for column_name in row
+            }
+            if not {"source", "destination"} <= set(canonical_names.values()):
+                lprint.exit("The spreadsheet must include 'source' and 'destination' columns.")
 
-    for row_index, row in sheet_records.items():
         normalized_row = {}
         for column_name, value in row.items():
-            normalized_name = _normalize_column_name(column_name)
-            canonical_name = VAR["column_aliases"].get(normalized_name, normalized_name)
-            normalized_row[canonical_name] = _normalize_cell_value(value)
+            canonical_name = canonical_names.get(column_name)
+            # Columns outside the plan are never read, so skip their cells.
+            if canonical_name is not None:
+                normalized_row[canonical_name] = _normalize_cell_value(value)
 
         source = normalized_row.get("source")
         destination = normalized_row.get("destination")
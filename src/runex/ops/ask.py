@@ -60,7 +60,7 @@ def confirmation(question: str) -> bool:
     """
 
     while True:
-        response = common.str2bool(input(f"{question} (yes/no): ").strip().lower(), silent=True)
+        response = common.str2bool(input(f"{question} (yes/no): "), silent=True)
         if response is not None:
             return response
         lprint.lprint(VAR["invalid_confirmation_message"])
@@ -136,11 +136,8 @@ def _normalize_option_items(
         if descriptions is None:
             return options, [(option, "") for option in options]
 
-        items = []
-        for index, option in enumerate(options):
-            description = descriptions[index] if index < len(descriptions) else ""
-            items.append((option, description))
-        return options, items
+        padding = [""] * max(len(options) - len(descriptions), 0)
+        return options, list(zip(options, [*descriptions, *padding]))
 
     lprint.exit("Options must be a list or a dictionary.")
     raise AssertionError("unreachable")
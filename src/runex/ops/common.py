@@ -29,16 +29,46 @@ __all__ = [
 #%% === Libraries ===
 import re
 import math
-import inspect
 import importlib
 import importlib.util
 import unicodedata
 
+from functools import lru_cache
 from typing import Any
 
 #%% === General Tools ===
 
 # ---------- Variables ----------
+def _build_float_patterns() -> dict[tuple[str, str], re.Pattern[str]]:
+    """
+    Compile the strict float pattern for each supported separator pair.
+
+    Returns:
+        dict[tuple[str, str], re.Pattern[str]]: Float patterns keyed by
+            `(thousands_sep, decimal_sep)`.
+    """
+
+    exponent_pattern = r"(?:[eE][+-]?\d+)?"
+    float_patterns: dict[tuple[str, str], re.Pattern[str]] = {}
+    for thousands_sep, decimal_sep in (("", "."), ("", ","), (",", "."), (".", ",")):
+        decimal_fragment_pattern = rf"{re.escape(decimal_sep)}\d+"
+        if thousands_sep:
+            grouped_integer_pattern = rf"(?:\d{{1,3}}(?:{re.escape(thousands_sep)}\d{{3}})+|\d+)"
+            float_pattern = (
+                rf"^[+-]?(?:"
+                rf"{grouped_integer_pattern}(?:{decimal_fragment_pattern})?"
+                rf"|{decimal_fragment_pattern}"
+                rf"){exponent_pattern}$"
+            )
+        else:
+            float_pattern = (
+                rf"^[+-]?(?:\d+(?:{decimal_fragment_pattern})?|{decimal_fragment_pattern})"
+                rf"{exponent_pattern}$"
+            )
+        float_patterns[(thousands_sep, decimal_sep)] = re.compile(float_pattern)
+    return float_patterns
+
+
 def global_variables() -> dict[str,Any]:
     """
     Return shared constants used across text helper functions.
@@ -49,9 +79,15 @@ def global_variables() -> dict[str,Any]:
             suffix factors.
     """
 
+    truthy_values = {"true", "yes", "1", "y"}
+    falsy_values = {"false", "no", "0", "n"}
     return {
-        "truthy_values": {"true", "yes", "1", "y"},
-        "falsy_values": {"false", "no", "0", "n"},
+        "truthy_values": truthy_values,
+        "falsy_values": falsy_values,
+        "bool_values": {
+            **dict.fromkeys(truthy_values, True),
+            **dict.fromkeys(falsy_values, False),
+        },
         "default_ignore_terms": [" ", ""],
         "default_valid_chars": r"_.|()[]{}-",
         "space_token_divisions": [" ", "\t", "\n", "\r", "\v", "\f"],
@@ -67,6 +103,15 @@ def global_variables() -> dict[str,Any]:
             "B": 1e9,
             "T": 1e12,
         },
+        "normalize_cache_size": 4096,
+        "numeric_like_pattern": re.compile(r"[+-]?[\d.,]+(?:[eE][+-]?\d*)?"),
+        "si_pattern": re.compile(
+            r"^[+-]?(?:(?:\d{1,3}(?:,\d{3})+|\d+)(?:\.\d+)?|\.\d+)(?:[eE][+-]?\d+)?$"
+        ),
+        "non_si_pattern": re.compile(
+            r"^[+-]?(?:(?:\d{1,3}(?:\.\d{3})+|\d+)(?:,\d+)?|,\d+)(?:[eE][+-]?\d+)?$"
+        ),
+        "float_patterns": _build_float_patterns(),
     }
 VAR = global_variables()
 
@@ -193,13 +238,65 @@ def str_normalize(
     lower = _validate_bool_argument(lower, False, argument_name="lower", error_type=TypeError)
     if not isinstance(text, str):
         raise TypeError("text must be a string")
+    if engine is not None and not isinstance(engine, str):
+        raise TypeError("engine must be a string or None")
+
+    valid_characters = frozenset(_resolve_valid_characters(valid_chars))
+    return _normalize_resolved_text(text, lower, valid_characters, engine)
+
+
+def _normalize_resolved_text(
+    text: str,
+    lower: bool,
+    valid_characters: frozenset[str],
+    engine: str | None,
+    ) -> str:
+    """
+    Normalize one string whose arguments were already validated and resolved.
+
+    Args:
+        text (str): Input string to normalize.
+        lower (bool): Convert the output to lowercase when `True`.
+        valid_characters (frozenset[str]): Extra characters to preserve.
+        engine (str | None): Optional transliteration engine.
+
+    Returns:
+        str: Normalized string value.
+    """
 
     normalized_text = text.strip()
     if not normalized_text:
         return ""
+    return _normalize_text_cached(normalized_text, lower, valid_characters, engine)
 
-    valid_characters = _resolve_valid_characters(valid_chars)
-    normalized_text = _transliterate_text(normalized_text, engine, valid_chars)
+
+@lru_cache(maxsize=VAR["normalize_cache_size"])
+def _normalize_text_cached(
+    text: str,
+    lower: bool,
+    valid_characters: frozenset[str],
+    engine: str | None,
+    ) -> str:
+    """
+    Normalize one stripped, validated string, memoizing repeated inputs.
+
+    Args:
+        text (str): Stripped, non-empty input string.
+        lower (bool): Convert the output to lowercase when `True`.
+        valid_characters (frozenset[str]): Extra characters to preserve.
+        engine (str | None): Optional transliteration engine.
+
+    Returns:
+        str: Normalized string value.
+    """
+
+    normalized_text = _transliterate_text(text, engine, set(valid_characters))
+
+    if normalized_text.isascii():
+        # ASCII characters have no decomposition, so one table lookup each is enough.
+        ascii_table = _build_ascii_normalize_table(frozenset(valid_characters), lower)
+        normalized_text = normalized_text.translate(ascii_table)
+        return " ".join(normalized_text.split())
 
     normalized_characters: list[str] = []
     for character in normalized_text:
@@ -217,7 +314,7 @@ def str_normalize(
             normalized_characters.append(" ")
 
     normalized_text = "".join(normalized_characters)
-    return re.sub(r"\s+", " ", normalized_text).strip()
+    return " ".join(normalized_text.split())
 
 
 def str2float(
@@ -286,7 +383,7 @@ def str2float(
     cleaned_value = value.strip()
     if not cleaned_value:
         return None
-    cleaned_value = re.sub(r"\s+", "", cleaned_value)
+    cleaned_value = "".join(cleaned_value.split())
     if not cleaned_value:
         return None
 
@@ -299,8 +396,7 @@ def str2float(
     thousands_sep, decimal_sep = "", "."
     has_comma = "," in mantissa_value
     has_dot = "." in mantissa_value
-    exponent_pattern = r"(?:[eE][+-]?\d+)?"
-    numeric_like = bool(re.fullmatch(r"[+-]?[\d.,]+(?:[eE][+-]?\d*)?", cleaned_value))
+    numeric_like = bool(VAR["numeric_like_pattern"].fullmatch(cleaned_value))
 
     if si_format is True:
         thousands_sep, decimal_sep = ",", "."
@@ -329,37 +425,15 @@ def str2float(
                 thousands_sep, decimal_sep = "", ","
 
     # --- PATTERN VALIDATION ---
-    si_pattern = (
-        rf"^[+-]?(?:(?:\d{{1,3}}(?:,\d{{3}})+|\d+)(?:\.\d+)?|\.\d+)"
-        rf"{exponent_pattern}$"
-    )
-    non_si_pattern = (
-        rf"^[+-]?(?:(?:\d{{1,3}}(?:\.\d{{3}})+|\d+)(?:,\d+)?|,\d+)"
-        rf"{exponent_pattern}$"
-    )
-    decimal_fragment_pattern = rf"{re.escape(decimal_sep)}\d+"
-
-    if thousands_sep:
-        grouped_integer_pattern = rf"(?:\d{{1,3}}(?:{re.escape(thousands_sep)}\d{{3}})+|\d+)"
-        float_pattern = (
-            rf"^[+-]?(?:"
-            rf"{grouped_integer_pattern}(?:{decimal_fragment_pattern})?"
-            rf"|{decimal_fragment_pattern}"
-            rf"){exponent_pattern}$"
-        )
-    else:
-        float_pattern = (
-            rf"^[+-]?(?:\d+(?:{decimal_fragment_pattern})?|{decimal_fragment_pattern})"
-            rf"{exponent_pattern}$"
-        )
+    float_pattern = VAR["float_patterns"][(thousands_sep, decimal_sep)]
 
-    if not re.fullmatch(float_pattern, cleaned_value):
+    if not float_pattern.fullmatch(cleaned_value):
         if not numeric_like:
             return None
 
-        if si_format is True and re.fullmatch(non_si_pattern, cleaned_value):
+        if si_format is True and VAR["non_si_pattern"].fullmatch(cleaned_value):
             return _raise_or_none("Input format conflicts with si_format=True", silent, ValueError)
-        if si_format is False and re.fullmatch(si_pattern, cleaned_value):
+        if si_format is False and VAR["si_pattern"].fullmatch(cleaned_value):
             return _raise_or_none("Input format conflicts with si_format=False", silent, ValueError)
 
         return _raise_or_none(f"Invalid numeric format: {cleaned_value}", silent, ValueError)
@@ -614,15 +688,13 @@ def str2bool(value: object, silent: bool = True) -> bool | None:
         return _raise_or_none("Boolean input cannot be empty", silent, ValueError)
 
     # --- NORMALIZATION AND RETURN ---
+    parsed_value = VAR["bool_values"].get(cleaned_value.lower())
+    if parsed_value is not None:
+        return parsed_value
+
     parsed_numeric_value = str2float(cleaned_value, silent=True)
     if parsed_numeric_value is not None and parsed_numeric_value in {0, 1}:
-        cleaned_value = str(int(parsed_numeric_value))
-    
-    normalized_value = cleaned_value.lower()
-    if normalized_value in VAR["truthy_values"]:
-        return True
-    if normalized_value in VAR["falsy_values"]:
-        return False
+        return bool(parsed_numeric_value)
 
     return _raise_or_none(f"Invalid boolean value: {cleaned_value}", silent, ValueError)
 
@@ -771,6 +843,37 @@ def _resolve_valid_characters(valid_chars: str | set[str] | None) -> set[str]:
     raise TypeError("valid_chars must be a string, set, or None")
 
 
+@lru_cache(maxsize=64)
+def _build_ascii_normalize_table(
+    valid_characters: frozenset[str],
+    lower: bool,
+) -> dict[int, str]:
+    """
+    Return the `str.translate` table `str_normalize` applies to ASCII text.
+
+    Args:
+        valid_characters (frozenset[str]): Characters to preserve as-is.
+        lower (bool): Lowercase letters when `True`.
+
+    Returns:
+        dict[int, str]: Replacement for each ASCII code point.
+    """
+
+    ascii_table: dict[int, str] = {}
+    for code_point in range(128):
+        character = chr(code_point)
+        if character in valid_characters:
+            ascii_table[code_point] = character
+            continue
+
+        normalized_character = character.lower() if lower else character
+        if normalized_character.isalnum() or normalized_character in valid_characters:
+            ascii_table[code_point] = normalized_character
+        else:
+            ascii_table[code_point] = " "
+    return ascii_table
+
+
 def _transliterate_text(
     text: str,
     engine: str | None = "Unidecode",
@@ -811,6 +914,8 @@ def _transliterate_text(
         case None:
             return text
         case str() as engine_name if engine_name.strip().casefold() == "unidecode":
+            if text.isascii():
+                return text
             unidecode_module = import_lib("unidecode", silent=True)
             if unidecode_module is None:
                 return text
@@ -923,17 +1028,18 @@ def match_terms_to_text(
     try:
 
         if normalize:
-            valid_chars = _resolve_valid_characters(valid_chars)
+            valid_characters = _resolve_valid_characters(valid_chars)
             for divider in token_division:
-                valid_chars.update(divider)
+                valid_characters.update(divider)
+            valid_characters = frozenset(valid_characters)
 
-            text = str_normalize(text, lower=True, valid_chars=valid_chars)
+            text = _normalize_resolved_text(text, True, valid_characters, "Unidecode")
             search_terms = [
-                str_normalize(term, lower=True, valid_chars=valid_chars)
+                _normalize_resolved_text(term, True, valid_characters, "Unidecode")
                 for term in search_terms
             ]
             ignore_terms = {
-                str_normalize(term, lower=True, valid_chars=valid_chars)
+                _normalize_resolved_text(term, True, valid_characters, "Unidecode")
                 for term in ignore_terms
             }
             token_division = _resolve_token_divisions(token_division, normalize_whitespace=True)
@@ -945,7 +1051,7 @@ def match_terms_to_text(
         raise
 
     # --- MATCHING ---
-    text_tokens = _split_match_tokens(text, token_division)
+    text_tokens = set(_split_match_tokens(text, token_division))
     for term in search_terms:
         if full_match:
             if not term and not text:
@@ -960,11 +1066,11 @@ def match_terms_to_text(
             continue
 
         if any(divider in term for divider in token_division):
-            if re.search(re.escape(term), text):
+            if term in text:
                 return True
             continue
 
-        if _has_matching_token_sequence(text_tokens, [term]):
+        if term in text_tokens:
             return True
 
     return False
@@ -982,32 +1088,25 @@ def _split_match_tokens(text: str, token_division: list[str]) -> list[str]:
     Returns:
         list[str]: Non-empty tokens derived from the input text.
     """
-    separator_pattern = "|".join(
-        re.escape(separator)
-        for separator in sorted(token_division, key=len, reverse=True)
-    )
-    return [token for token in re.split(separator_pattern, text) if token]
+    separator_pattern = _compile_separator_pattern(tuple(token_division))
+    return [token for token in separator_pattern.split(text) if token]
 
 
-def _has_matching_token_sequence(text_tokens: list[str], term_tokens: list[str]) -> bool:
+@lru_cache(maxsize=64)
+def _compile_separator_pattern(token_division: tuple[str, ...]) -> re.Pattern[str]:
     """
-    Return `True` when the term token sequence appears in the text tokens.
+    Return the compiled alternation that splits text on any delimiter.
 
     Args:
-        text_tokens (list[str]): Tokenized input text.
-        term_tokens (list[str]): Tokenized term to search for.
+        token_division (tuple[str, ...]): Delimiters used to define tokens.
 
     Returns:
-        bool: Whether the term tokens appear contiguously in the text.
+        re.Pattern[str]: Pattern matching the longest delimiter first.
     """
-    term_length = len(term_tokens)
-    if term_length == 0 or term_length > len(text_tokens):
-        return False
-
-    for start_index in range(len(text_tokens) - term_length + 1):
-        if text_tokens[start_index:start_index + term_length] == term_tokens:
-            return True
-    return False
+    return re.compile("|".join(
+        re.escape(separator)
+        for separator in sorted(token_division, key=len, reverse=True)
+    ))
 
 
 def _resolve_token_divisions(
@@ -1059,15 +1158,7 @@ def _resolve_token_divisions(
     if normalize_whitespace:
         divisions = [" " if divider.isspace() else divider for divider in divisions]
 
-    unique_divisions: list[str] = []
-    seen_divisions: set[str] = set()
-    for divider in divisions:
-        if divider in seen_divisions:
-            continue
-        seen_divisions.add(divider)
-        unique_divisions.append(divider)
-
-    return unique_divisions
+    return list(dict.fromkeys(divisions))
 
 
 def normalize_keys_in_dict(
@@ -1184,7 +1275,7 @@ def normalize_keys_in_dict(
 
         # --- GROUP MATCHING KEYS ---
         grouped_keys: dict[str, list[str]] = {}
-        for key in list(current_dict.keys()):
+        for key in current_dict:
             if not isinstance(key, str):
                 continue
 
@@ -1308,21 +1399,41 @@ def is_valid_string(
 
     if normalize:
         value_to_check = str_normalize(value, lower=not case_sensitive)
-        options_to_check = [
-            str_normalize(option, lower=not case_sensitive)
-            for option in allowed_options
-        ]
     else:
         value_to_check = value if case_sensitive else value.casefold()
-        options_to_check = (
-            allowed_options
-            if case_sensitive
-            else [option.casefold() for option in allowed_options]
-        )
 
+    options_to_check = _resolve_allowed_options(tuple(allowed_options), case_sensitive, normalize)
     return value_to_check in options_to_check
 
 
+@lru_cache(maxsize=128)
+def _resolve_allowed_options(
+    allowed_options: tuple[str, ...],
+    case_sensitive: bool,
+    normalize: bool,
+    ) -> frozenset[str]:
+    """
+    Return the comparison set `is_valid_string` builds from allowed options.
+
+    Args:
+        allowed_options (tuple[str, ...]): Accepted options.
+        case_sensitive (bool): Match with case sensitivity when `True`.
+        normalize (bool): Compare normalized values when `True`.
+
+    Returns:
+        frozenset[str]: Options transformed the same way as the checked value.
+    """
+
+    if normalize:
+        return frozenset(
+            str_normalize(option, lower=not case_sensitive)
+            for option in allowed_options
+        )
+    if case_sensitive:
+        return frozenset(allowed_options)
+    return frozenset(option.casefold() for option in allowed_options)
+
+
 def is_valid_number(value: object) -> bool:
     """
     Return `True` when a value is a finite integer or float.
@@ -1404,7 +1515,7 @@ def _is_non_finite_numeric_string(value: str) -> bool:
         bool: Whether the input is a non-finite numeric token.
     """
 
-    cleaned_value = re.sub(r"\s+", "", value.strip())
+    cleaned_value = "".join(value.split())
     if not cleaned_value:
         return False
     return cleaned_value.lower().lstrip("+-") in {"nan", "inf", "infinity"}
@@ -1456,6 +1567,8 @@ def _validate_bool_argument(
     """
 
     if argument_name is None:
+        import inspect
+
         frame = inspect.currentframe()
         caller_frame = frame.f_back if frame is not None else None
         try:
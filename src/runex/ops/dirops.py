@@ -23,6 +23,7 @@ __all__ = [
     "move_path",
     "rename_path",
     "run_mkdir",
+    "scan_tree",
     "unpack_archive",
     "validate_file_path",
     "would_create_infloop",
@@ -31,16 +32,38 @@ __all__ = [
 #%% === Libraries ===
 import os
 import re
+import sys
 import stat
 import shutil
 import unicodedata
 
-from typing import Any
+from functools import lru_cache
+from typing import Any, Iterator
 from pathlib import Path
 
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - not available on Windows
+    fcntl = None
+
 #%% === General Tools ===
 
 # ---------- Variables ----------
+def _detect_host_os() -> str:
+    """
+    Return the host path family used by path conversion helpers.
+
+    Returns:
+        str: ``"windows"``, ``"linux"``, ``"posix"``, or ``"other"``.
+    """
+
+    if os.name == "nt":
+        return "windows"
+    if os.name == "posix":
+        return "linux" if os.uname().sysname == "Linux" else "posix"
+    return "other"
+
+
 def global_variables() -> dict[str, Any]:
     """
     Return shared configuration values used across path helpers.
@@ -49,13 +72,15 @@ def global_variables() -> dict[str, Any]:
         dict[str, Any]: Precompiled regex patterns and shared path settings.
     """
 
-    return {
-        "unicode_strip_pattern": re.compile(r"[\u200B-\u200D\uFEFF]"),
-        "control_char_pattern": re.compile(r"[\x00-\x1F\x7F]"),
+    variables = {
+        "path_strip_pattern": re.compile(r"[\x00-\x1F\x7F\u200B-\u200D\uFEFF]"),
         "illegal_path_patterns": {
             True: re.compile(r'[<>"|?*]'),
             False: re.compile(r'[<>"|]'),
         },
+        "repeated_separator_pattern": re.compile(r"[\\/]+"),
+        "repeated_slash_pattern": re.compile(r"/{2,}"),
+        "wsl_drive_pattern": re.compile(r"^/mnt/([a-z])/(.*)"),
         "path_patterns": {
             "windows_extended": re.compile(r"^\\\\\?\\\\"),
             "windows_device": re.compile(r"^\\\\\.\\\\"),
@@ -64,7 +89,21 @@ def global_variables() -> dict[str, Any]:
             "windows_drive_rel": re.compile(r"^[A-Za-z]:(?![\\/])"),
             "wsl": re.compile(r"^/mnt/[a-z]/"),
         },
+        "host_os": _detect_host_os(),
+        "ficlone_request": getattr(fcntl, "FICLONE", 0x40049409),
+        "unpack_formats": {
+            extension.lower(): format_name
+            for format_name, extensions, _ in shutil.get_unpack_formats()
+            for extension in extensions
+        },
     }
+    variables["unpack_extensions"] = tuple(
+        sorted(
+            variables["unpack_formats"],
+            key=lambda extension: (-len(extension), extension),
+        )
+    )
+    return variables
 
 
 VAR = global_variables()
@@ -113,13 +152,15 @@ def delete_paths(paths: str | list[str], force: bool = False) -> None:
                 shutil.rmtree(normalized_path)
 
 
-def copy_path(src: str, dst: str) -> None:
+def copy_path(src: str, dst: str, make_parents: bool = True) -> None:
     """
     Copy a file or directory tree from source to destination.
 
     Args:
         src (str): Source file or directory path.
         dst (str): Destination file or directory path.
+        make_parents (bool): Create the destination parent directory first.
+            Pass ``False`` when the caller has already created it.
     """
 
     src = fix_path(src)
@@ -129,26 +170,32 @@ def copy_path(src: str, dst: str) -> None:
         shutil.copytree(src, dst, dirs_exist_ok=True)
         return
 
-    parent = os.path.dirname(dst)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
+    if make_parents:
+        _make_parent_dir(dst)
+    if os.path.isdir(dst):
+        dst = os.path.join(dst, os.path.basename(src))
+
+    if _copy_file_in_kernel(src, dst):
+        shutil.copystat(src, dst)
+        return
     shutil.copy2(src, dst)
 
 
-def move_path(src: str, dst: str) -> None:
+def move_path(src: str, dst: str, make_parents: bool = True) -> None:
     """
     Move a file or directory tree from source to destination.
 
     Args:
         src (str): Source file or directory path.
         dst (str): Destination file or directory path.
+        make_parents (bool): Create the destination parent directory first.
+            Pass ``False`` when the caller has already created it.
     """
 
     src = fix_path(src)
     dst = fix_path(dst)
-    parent = os.path.dirname(dst)
-    if parent:
-        os.makedirs(parent, exist_ok=True)
+    if make_parents:
+        _make_parent_dir(dst)
     shutil.move(src, dst)
 
 
@@ -194,7 +241,11 @@ def unpack_archive(
     if not override and os.path.isdir(destination):
         return False
 
-    shutil.unpack_archive(src, destination)
+    shutil.unpack_archive(
+        src,
+        destination,
+        format=VAR["unpack_formats"][extension.lower()],
+    )
     return True
 
 
@@ -232,6 +283,47 @@ def locate_files_by_name_pattern(folder_path: str, filename: str) -> list[Path]:
     return list(folder.glob(f"*{filename}*"))
 
 
+def scan_tree(
+    path: str,
+) -> Iterator[tuple[str, list[os.DirEntry[str]], list[os.DirEntry[str]]]]:
+    """
+    Walk a directory tree top-down using cached ``os.scandir`` entries.
+
+    Args:
+        path (str): Root directory to scan.
+
+    Yields:
+        tuple[str, list[os.DirEntry[str]], list[os.DirEntry[str]]]: Current
+        directory path, its subdirectory entries, and its file entries.
+
+    Notes:
+        Symlinked directories are not followed. Directories that cannot be
+        read are skipped, matching the default ``os.walk`` behavior.
+    """
+
+    pending = [fix_path(path)]
+    while pending:
+        root = pending.pop()
+        dir_entries: list[os.DirEntry[str]] = []
+        file_entries: list[os.DirEntry[str]] = []
+
+        try:
+            with os.scandir(root) as iterator:
+                for entry in iterator:
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            dir_entries.append(entry)
+                        elif entry.is_file():
+                            file_entries.append(entry)
+                    except OSError:
+                        continue
+        except OSError:
+            continue
+
+        yield root, dir_entries, file_entries
+        pending.extend(entry.path for entry in reversed(dir_entries))
+
+
 def validate_file_path(
     file_path: str,
     supported_extensions: list[str] | str | None = None,
@@ -252,17 +344,19 @@ def validate_file_path(
         raise TypeError("file_path must be a string")
 
     normalized_path = fix_path(file_path)
-    if not os.path.exists(normalized_path):
-        raise FileNotFoundError(normalized_path)
-    if not os.path.isfile(normalized_path):
+    try:
+        path_stat = os.stat(normalized_path)
+    except (OSError, ValueError):
+        raise FileNotFoundError(normalized_path) from None
+    if not stat.S_ISREG(path_stat.st_mode):
         raise IsADirectoryError(normalized_path)
 
     if supported_extensions is not None:
         if isinstance(supported_extensions, str):
             supported_extensions = [supported_extensions]
 
-        normalized_extensions = [extension.lower() for extension in supported_extensions]
-        _, extension = os.path.splitext(normalized_path)
+        normalized_extensions = {extension.lower() for extension in supported_extensions}
+        extension = os.path.splitext(normalized_path)[1]
         if extension.lower() not in normalized_extensions:
             raise ValueError(f"Unsupported file extension: {extension}")
 
@@ -280,22 +374,44 @@ def fix_path(path: str, ascii_only: bool = False, remove_globs: bool = True) ->
 
     Returns:
         str: Cleaned filesystem path.
+
+    Notes:
+        On a Linux host, Windows-style inputs are converted as follows:
+        ``\\\\server\\share\\dir`` becomes ``//server/share/dir``,
+        ``C:\\Users\\lex`` becomes ``/mnt/c/Users/lex``, and ``C:data``
+        becomes ``/mnt/c/data``. WSL paths such as ``/mnt/c/Users/lex`` are
+        only normalized. On Windows, UNC paths keep their ``\\\\`` prefix
+        and WSL paths become ``C:\\Users\\lex``.
     """
 
     if not isinstance(path, str) or not path:
         raise TypeError("path must be a non-empty string")
 
-    cleaned_path = path.strip()
-    cleaned_path = VAR["unicode_strip_pattern"].sub("", cleaned_path)
-    cleaned_path = VAR["control_char_pattern"].sub("", cleaned_path)
+    return _fix_path_cached(path, bool(ascii_only), bool(remove_globs))
+
+
+@lru_cache(maxsize=512)
+def _fix_path_cached(path: str, ascii_only: bool, remove_globs: bool) -> str:
+    """
+    Sanitize one validated path string, memoizing repeated inputs.
+
+    Args:
+        path (str): Raw filesystem path.
+        ascii_only (bool): Remove non-ASCII characters when ``True``.
+        remove_globs (bool): Remove wildcard characters when ``True``.
+
+    Returns:
+        str: Cleaned filesystem path.
+    """
+
+    cleaned_path = VAR["path_strip_pattern"].sub("", path.strip())
 
     if ascii_only:
-        cleaned_path = re.sub(r"[^\x00-\x7F]", "", cleaned_path)
+        cleaned_path = cleaned_path.encode("ascii", "ignore").decode("ascii")
     else:
         cleaned_path = unicodedata.normalize("NFC", cleaned_path)
 
-    illegal_pattern = VAR["illegal_path_patterns"][remove_globs]
-    cleaned_path = illegal_pattern.sub("", cleaned_path)
+    cleaned_path = VAR["illegal_path_patterns"][remove_globs].sub("", cleaned_path)
     return _convert_path_to_current_os(cleaned_path)
 
 
@@ -343,21 +459,21 @@ def find_files_by_regex(
 
     normalized_base_path = fix_path(base_path)
     file_regex = re.compile(file_pattern)
-    matched_files: list[str] = []
 
     if recursive:
-        for root, _, files in os.walk(normalized_base_path):
-            for file_name in files:
-                if file_regex.match(file_name):
-                    matched_files.append(os.path.join(root, file_name))
-        return matched_files
+        return [
+            entry.path
+            for _, _, file_entries in scan_tree(normalized_base_path)
+            for entry in file_entries
+            if file_regex.match(entry.name)
+        ]
 
-    for file_name in os.listdir(normalized_base_path):
-        full_path = os.path.join(normalized_base_path, file_name)
-        if os.path.isfile(full_path) and file_regex.match(file_name):
-            matched_files.append(full_path)
-
-    return matched_files
+    with os.scandir(normalized_base_path) as iterator:
+        return [
+            entry.path
+            for entry in iterator
+            if entry.is_file() and file_regex.match(entry.name)
+        ]
 
 
 def make_dir_dict(
@@ -444,10 +560,9 @@ def detect_unpack_format(path: str) -> tuple[bool, str]:
         return False, ""
 
     normalized_lower = normalized_path.lower()
-    for _, extensions, _ in shutil.get_unpack_formats():
-        for extension in extensions:
-            if normalized_lower.endswith(extension.lower()):
-                return True, extension
+    for extension in VAR["unpack_extensions"]:
+        if normalized_lower.endswith(extension.lower()):
+            return True, extension
 
     return False, ""
 
@@ -493,9 +608,14 @@ def _convert_path_to_current_os(path: str) -> str:
     if not path:
         return path
 
-    is_windows = os.name == "nt"
-    is_posix = os.name == "posix"
-    is_linux = is_posix and os.uname().sysname == "Linux"
+    host_os = VAR["host_os"]
+    is_windows = host_os == "windows"
+    is_posix = host_os in {"linux", "posix"}
+    is_linux = host_os == "linux"
+
+    # Plain POSIX paths cannot match any Windows pattern.
+    if is_posix and "\\" not in path and path[1:2] != ":":
+        return os.path.normpath(path)
 
     path_type = "relative"
     for name, pattern in VAR["path_patterns"].items():
@@ -505,10 +625,10 @@ def _convert_path_to_current_os(path: str) -> str:
 
     if is_windows:
         if path_type == "windows_unc":
-            body = re.sub(r"[\\/]+", r"\\", path[2:])
+            body = VAR["repeated_separator_pattern"].sub(r"\\", path[2:])
             return os.path.normpath("\\\\" + body)
         if path_type == "wsl":
-            match = re.match(r"^/mnt/([a-z])/(.*)", path)
+            match = VAR["wsl_drive_pattern"].match(path)
             if match:
                 drive = match.group(1).upper()
                 rest = match.group(2).replace("/", "\\")
@@ -523,7 +643,7 @@ def _convert_path_to_current_os(path: str) -> str:
     if is_posix:
         if path_type == "windows_unc":
             body = path[2:].replace("\\", "/")
-            return os.path.normpath("//" + re.sub(r"/{2,}", "/", body))
+            return os.path.normpath("//" + VAR["repeated_slash_pattern"].sub("/", body))
         if path_type == "windows_drive_rel":
             path = path[:2] + "\\" + path[2:]
             path_type = "windows_drive_abs"
@@ -536,6 +656,80 @@ def _convert_path_to_current_os(path: str) -> str:
     return path
 
 
+def _make_parent_dir(path: str) -> None:
+    """
+    Create the parent directory of one path when it has one.
+
+    Args:
+        path (str): File path whose parent should exist.
+    """
+
+    parent = os.path.dirname(path)
+    if parent:
+        os.makedirs(parent, exist_ok=True)
+
+
+def _copy_file_in_kernel(src: str, dst: str) -> bool:
+    """
+    Copy regular-file contents with a Linux clone or ``copy_file_range``.
+
+    Args:
+        src (str): Source file path.
+        dst (str): Destination file path.
+
+    Returns:
+        bool: ``True`` when every byte was copied, or ``False`` when the
+        caller should fall back to ``shutil.copy2``.
+
+    Notes:
+        ``FICLONE`` shares extents on copy-on-write filesystems such as Btrfs
+        and XFS. ``copy_file_range`` keeps the copy inside the kernel.
+        Metadata is not copied here.
+    """
+
+    if not sys.platform.startswith("linux"):
+        return False
+
+    try:
+        src_stat = os.stat(src)
+        if not stat.S_ISREG(src_stat.st_mode) or src_stat.st_size == 0:
+            return False
+        if os.path.exists(dst) and os.path.samestat(src_stat, os.stat(dst)):
+            return False
+    except OSError:
+        return False
+
+    with open(src, "rb") as src_file, open(dst, "wb") as dst_file:
+        src_fd = src_file.fileno()
+        dst_fd = dst_file.fileno()
+
+        if fcntl is not None:
+            try:
+                fcntl.ioctl(dst_fd, VAR["ficlone_request"], src_fd)
+                return True
+            except OSError:
+                pass
+
+        if not hasattr(os, "copy_file_range"):
+            return False
+
+        copied = 0
+        try:
+            while copied < src_stat.st_size:
+                chunk_size = os.copy_file_range(src_fd, dst_fd, src_stat.st_size - copied)
+                if chunk_size == 0:
+                    break
+                copied += chunk_size
+        except OSError:
+            if copied:
+                raise
+            return False
+
+    # Some filesystems report 0 bytes without copying anything; shutil.copy2
+    # then rewrites the whole destination.
+    return copied == src_stat.st_size
+
+
 def _remove_readonly(func, path: str, _) -> None:
     """
     Clear the readonly bit and retry a filesystem operation.
@@ -22,12 +22,12 @@ __all__ = [
 ]
 
 #%% === Libraries ===
-import inspect
 import logging
 import os
 import re
 import shutil
 import sys
+import time
 
 from datetime import datetime
 from os import PathLike
@@ -49,6 +49,7 @@ def global_variables() -> dict[str, Any]:
         "default_end": "\n",
         "default_sep": " ",
         "ansi_reset": "\033[0m",
+        "terminal_width_ttl": 1.0,
         "ansi_escape_pattern": re.compile(r"\x1B\[[0-?]*[ -/]*[@-~]"),
         "level_labels": {
             logging.DEBUG: "DEBUG",
@@ -78,6 +79,8 @@ class LPrint:
 
     Attributes:
         _log_file (Path | None): File used to store emitted messages.
+        _terminal_width_cache (tuple[float, int] | None): Last measured
+            terminal width and the monotonic time it was measured.
     """
 
     def __init__(self, log_file: str | PathLike[str] | None = None) -> None:
@@ -89,6 +92,7 @@ class LPrint:
         """
 
         self._log_file: Path | None = None
+        self._terminal_width_cache: tuple[float, int] | None = None
         self.configure_logger(log_file)
 
     def __call__(
@@ -377,11 +381,28 @@ class LPrint:
         if len(fill_char) != 1:
             raise ValueError("fill_char must be exactly one character")
 
-        terminal_width = shutil.get_terminal_size(fallback=(80, 20)).columns
-        dots_needed = max(0, terminal_width - len(prefix) - len(suffix))
-        return f"{prefix}{fill_char * dots_needed}{suffix}"
+        terminal_width = self._get_terminal_width()
+        return prefix.ljust(terminal_width - len(suffix), fill_char) + suffix
 
     # ---------- Internal Tools ----------
+    def _get_terminal_width(self) -> int:
+        """
+        Return the terminal width, measured at most once per cache period.
+
+        Returns:
+            int: Terminal width in columns.
+        """
+
+        now = time.monotonic()
+        if self._terminal_width_cache is not None:
+            measured_at, terminal_width = self._terminal_width_cache
+            if now - measured_at < VAR["terminal_width_ttl"]:
+                return terminal_width
+
+        terminal_width = shutil.get_terminal_size(fallback=(80, 20)).columns
+        self._terminal_width_cache = (now, terminal_width)
+        return terminal_width
+
     def _print_level_block(
         self,
         *values: object,
@@ -490,7 +511,7 @@ class LPrint:
             str: Centered title line sized to the current terminal width.
         """
 
-        terminal_width = shutil.get_terminal_size(fallback=(80, 20)).columns
+        terminal_width = self._get_terminal_width()
         centered_label = f" {level_label} "
         if len(centered_label) >= terminal_width:
             return centered_label
@@ -560,6 +581,8 @@ class LPrint:
             tuple[str | None, str | None]: Caller module stem and line number.
         """
 
+        import inspect
+
         frame = inspect.currentframe()
         try:
             for _ in range(stack_depth):
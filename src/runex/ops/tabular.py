@@ -9,13 +9,21 @@ Sections:
 
 from __future__ import annotations
 
-__all__ = ["SPREADSHEET_EXTENSIONS", "excel_safe_append", "load_spreadsheet"]
+__all__ = [
+    "SPREADSHEET_EXTENSIONS",
+    "clear_spreadsheet_cache",
+    "excel_safe_append",
+    "iter_spreadsheet_rows",
+    "load_spreadsheet",
+    "normalize_series",
+]
 
 #%% === Libraries ===
 import os
+import csv
 
-from typing import TYPE_CHECKING, Any
-from pathlib import Path
+from functools import lru_cache
+from typing import TYPE_CHECKING, Any, Iterator, Sequence
 
 if TYPE_CHECKING:
     import pandas as pd
@@ -26,20 +34,59 @@ from . import common, dirops
 #%% === General Tools ===
 
 # ---------- Variables ----------
-def global_variables() -> dict[str, dict[str, list[str]]]:
+def global_variables() -> dict[str, Any]:
     """
     Return shared spreadsheet configuration values.
 
     Returns:
-        dict[str, dict[str, list[str]]]: Supported spreadsheet extensions.
+        dict[str, Any]: Supported spreadsheet extensions and reader settings.
     """
 
-    return {
+    variables = {
         "spreadsheet_extensions": {
             "excel": [".xls", ".xlsx"],
             "csv": [".csv"],
-        }
+        },
+        "spreadsheet_cache_size": 16,
+        # pandas' default ``na_values``, applied to streamed rows as well.
+        "na_values": frozenset(
+            {
+                "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN",
+                "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL",
+                "NaN", "None", "n/a", "nan", "null",
+            }
+        ),
+        "calamine_min_pandas_version": (2, 2),
+        "pyarrow_csv_unsupported_kwargs": frozenset(
+            {
+                "chunksize",
+                "comment",
+                "converters",
+                "dayfirst",
+                "delim_whitespace",
+                "dialect",
+                "float_precision",
+                "iterator",
+                "lineterminator",
+                "low_memory",
+                "memory_map",
+                "nrows",
+                "on_bad_lines",
+                "quoting",
+                "skipfooter",
+                "skipinitialspace",
+                "thousands",
+            }
+        ),
+    }
+    variables["extension_sets"] = {
+        kind: frozenset(extension.lower() for extension in extensions)
+        for kind, extensions in variables["spreadsheet_extensions"].items()
     }
+    variables["supported_extensions"] = sorted(
+        variables["extension_sets"]["csv"] | variables["extension_sets"]["excel"]
+    )
+    return variables
 
 
 VAR = global_variables()
@@ -66,7 +113,7 @@ def _resolve_load_settings(
     index_1thcol: bool,
     index_key: bool,
     kwargs: dict[str, Any],
-) -> tuple[list[str], list[str], int | bool, int | None, str]:
+) -> tuple[frozenset[str], frozenset[str], int | bool, int | None, str]:
     """
     Resolve extensions and pandas keyword defaults for spreadsheet loading.
 
@@ -79,19 +126,69 @@ def _resolve_load_settings(
         kwargs (dict[str, Any]): Additional pandas keyword arguments.
 
     Returns:
-        tuple[list[str], list[str], int | bool, int | None, str]: CSV
-        extensions, Excel extensions, index column setting, header setting,
+        tuple[frozenset[str], frozenset[str], int | bool, int | None, str]:
+        Lowercase CSV extensions, Excel extensions, index column setting, header setting,
         and dict orientation.
     """
 
-    csv_extensions = SPREADSHEET_EXTENSIONS["csv"]
-    excel_extensions = SPREADSHEET_EXTENSIONS["excel"]
+    csv_extensions = VAR["extension_sets"]["csv"]
+    excel_extensions = VAR["extension_sets"]["excel"]
     index_col = kwargs.pop("index_col", 0 if index_1thcol else False)
     header = kwargs.pop("header", 0 if header_1throw else None)
     orient = kwargs.pop("orient", "index" if index_key else "dict")
     return csv_extensions, excel_extensions, index_col, header, orient
 
 
+def _resolve_csv_engine(
+    index_col: int | bool | None,
+    kwargs: dict[str, Any],
+) -> int | bool | None:
+    """
+    Select the pyarrow CSV engine when it is installed and compatible.
+
+    Args:
+        index_col (int | bool | None): Resolved index column setting.
+        kwargs (dict[str, Any]): Additional pandas keyword arguments. The
+            ``engine`` key is set in place when pyarrow is selected.
+
+    Returns:
+        int | bool | None: Index column setting accepted by the chosen engine.
+    """
+
+    if "engine" in kwargs or not common.is_lib_installed("pyarrow"):
+        return index_col
+    if not VAR["pyarrow_csv_unsupported_kwargs"].isdisjoint(kwargs):
+        return index_col
+    separator = kwargs.get("sep", kwargs.get("delimiter", ","))
+    if not isinstance(separator, str) or len(separator) != 1:
+        return index_col
+
+    kwargs["engine"] = "pyarrow"
+    return None if index_col is False else index_col
+
+
+def _resolve_excel_engine(pandas_module: Any, kwargs: dict[str, Any]) -> None:
+    """
+    Select the calamine Excel engine when it is installed and supported.
+
+    Args:
+        pandas_module (Any): Imported pandas module.
+        kwargs (dict[str, Any]): Additional pandas keyword arguments. The
+            ``engine`` key is set in place when calamine is selected.
+    """
+
+    if "engine" in kwargs or not common.is_lib_installed("python_calamine"):
+        return
+
+    version_parts = pandas_module.__version__.split(".")[:2]
+    try:
+        pandas_version = tuple(int(part) for part in version_parts)
+    except ValueError:
+        return
+    if pandas_version >= VAR["calamine_min_pandas_version"]:
+        kwargs["engine"] = "calamine"
+
+
 #%% === Tabular Helpers ===
 def load_spreadsheet(
     file_path: str,
@@ -100,6 +197,9 @@ def load_spreadsheet(
     index_1thcol: bool = False,
     index_key: bool = False,
     dtype: str = "df",
+    cache: bool = False,
+    dtype_hints: Any = None,
+    fast_csv: bool = False,
     **kwargs,
 ) -> pd.DataFrame | dict:
     """
@@ -112,14 +212,38 @@ def load_spreadsheet(
         index_1thcol (bool): Whether the first column should become the index.
         index_key (bool): Whether dict output should be oriented by index.
         dtype (str): Output format, either ``"df"`` or ``"dict"``.
-        **kwargs: Extra arguments forwarded to pandas readers.
+        cache (bool): Reuse the parsed DataFrame of an earlier call with the
+            same file, file modification time, and read settings. Cached
+            DataFrames are returned as copies. Reads with ``chunksize`` or
+            ``iterator`` are never cached.
+        dtype_hints (Any): Column dtypes forwarded to pandas as its ``dtype``
+            argument, which skips type inference for those columns.
+        fast_csv (bool): Parse CSV files with the multithreaded pyarrow
+            engine when it is installed and supports every keyword given.
+        **kwargs: Extra arguments forwarded to pandas readers. Limits such as
+            ``nrows``, ``usecols`` and ``skiprows`` are applied while parsing,
+            so unread rows and columns are never converted.
 
     Returns:
         pd.DataFrame | dict: Loaded spreadsheet data.
+
+    Notes:
+        CSV files are parsed with pandas' default engine unless ``fast_csv``
+        is set. With ``fast_csv``, a read that pyarrow rejects is retried on
+        the default parser. pyarrow infers dates and timestamps, so values
+        such as ``2024-01-05`` come back as dates instead of strings.
+        Excel files are read with the Rust-based calamine engine when
+        python-calamine is installed and pandas is 2.2 or newer; pass
+        ``engine="openpyxl"`` to opt out.
+        With ``dtype="dict"``, a CSV ``chunksize`` reads the file in chunks and
+        merges each chunk into the result, so the whole DataFrame is never
+        held in memory at once.
     """
 
     if not common.is_valid_string(dtype, ["df", "dict"]):
         raise ValueError(f"Invalid dtype: {dtype}. Allowed options are: df, dict")
+    if dtype_hints is not None:
+        kwargs["dtype"] = dtype_hints
 
     csv_extensions, excel_extensions, index_col, header, orient = (
         _resolve_load_settings(
@@ -132,33 +256,160 @@ def load_spreadsheet(
 
     validated_path = dirops.validate_file_path(
         file_path,
-        supported_extensions=csv_extensions + excel_extensions,
+        supported_extensions=VAR["supported_extensions"],
     )
-    suffix = Path(validated_path).suffix.lower()
-    pd = _import_pandas()
+    suffix = os.path.splitext(validated_path)[1].lower()
 
-    if suffix in csv_extensions:
-        data_frame = pd.read_csv(
+    if suffix in csv_extensions and dtype == "dict" and kwargs.get("chunksize"):
+        pd = _import_pandas()
+        with pd.read_csv(
             validated_path,
             header=header,
             index_col=index_col,
             **kwargs,
-        )
-    elif suffix in excel_extensions:
+        ) as chunks:
+            return _merge_chunk_dicts(pd, chunks, orient)
+
+    read_settings = (validated_path, suffix, tab_name, header, index_col, fast_csv)
+    # Chunked reads return an open TextFileReader, which must not be shared.
+    if not cache or kwargs.get("chunksize") or kwargs.get("iterator"):
+        data_frame = _read_data_frame(*read_settings, kwargs)
+        return data_frame if dtype == "df" else data_frame.to_dict(orient=orient)
+
+    data_frame = _read_data_frame_with_cache(*read_settings, kwargs)
+    if dtype == "df":
+        return data_frame.copy()
+
+    return data_frame.to_dict(orient=orient)
+
+
+def clear_spreadsheet_cache() -> None:
+    """Drop every DataFrame kept by ``load_spreadsheet(..., cache=True)``."""
+
+    _read_cached_data_frame.cache_clear()
+
+
+def iter_spreadsheet_rows(
+    file_path: str,
+    tab_name: str | None = None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Yield spreadsheet data rows as dictionaries keyed by header name.
+
+    Args:
+        file_path (str): Spreadsheet path.
+        tab_name (str | None): Excel sheet name when reading Excel files.
+
+    Yields:
+        dict[str, Any]: One data row keyed by the first-row header labels.
+
+    Notes:
+        CSV files are streamed with the standard ``csv`` module, so rows are
+        never held in memory together and pandas is not required. ``.xlsx``
+        files are streamed the same way through openpyxl's read-only mode
+        when openpyxl is installed. As with pandas, blank CSV lines are
+        skipped, every row carries all header labels, and blank cells or
+        text cells matching a default NA token such as ``NA`` or ``NULL``
+        are returned as ``None``. ``.xlsx`` cells past the last header label
+        are kept under ``Unnamed: N`` keys; CSV rows drop them, as pandas
+        does with ``index_col=False``.
+        Blank and duplicate header labels are renamed the same way pandas
+        does, for example ``Unnamed: 2`` and ``name.1``.
+    """
+
+    csv_extensions = VAR["extension_sets"]["csv"]
+    excel_extensions = VAR["extension_sets"]["excel"]
+    validated_path = dirops.validate_file_path(
+        file_path,
+        supported_extensions=VAR["supported_extensions"],
+    )
+    suffix = os.path.splitext(validated_path)[1].lower()
+
+    if suffix in csv_extensions:
+        with open(validated_path, newline="", encoding="utf-8-sig") as file_obj:
+            reader = csv.reader(file_obj)
+            header = next(reader, None)
+            if header is None:
+                return
+
+            column_names = _deduplicate_headers(header)
+            column_count = len(column_names)
+            na_values = VAR["na_values"]
+            for row in reader:
+                if not row or (len(row) == 1 and not row[0].strip()):
+                    continue
+
+                values = [None if value in na_values else value for value in row[:column_count]]
+                values.extend([None] * (column_count - len(values)))
+                yield dict(zip(column_names, values))
+        return
+
+    if suffix == ".xlsx" and common.is_lib_installed("openpyxl"):
+        yield from _iter_xlsx_rows(validated_path, tab_name)
+        return
+
+    if suffix in excel_extensions:
+        pd = _import_pandas()
+        reader_kwargs: dict[str, Any] = {}
+        _resolve_excel_engine(pd, reader_kwargs)
         data_frame = pd.read_excel(
             validated_path,
             sheet_name=0 if tab_name is None else tab_name,
-            header=header,
-            index_col=index_col,
-            **kwargs,
+            header=0,
+            **reader_kwargs,
         )
-    else:
-        raise ValueError(f"Unsupported spreadsheet extension: {suffix}")
+        yield from data_frame.to_dict(orient="records")
+        return
 
-    if dtype == "df":
-        return data_frame
+    raise ValueError(f"Unsupported spreadsheet extension: {suffix}")
 
-    return data_frame.to_dict(orient=orient)
+
+def normalize_series(
+    series: pd.Series,
+    lower: bool = False,
+    valid_chars: str | set[str] | None = common.VAR["default_valid_chars"],
+    engine: str | None = "Unidecode",
+) -> pd.Series:
+    """
+    Apply ``common.str_normalize`` to every string cell of a Series.
+
+    Args:
+        series (pd.Series): Column to normalize.
+        lower (bool): Convert the output to lowercase when ``True``.
+        valid_chars (str | set[str] | None): Extra characters to preserve.
+        engine (str | None): Optional transliteration engine.
+
+    Returns:
+        pd.Series: Copy of ``series`` with string cells normalized. Other
+        cells, including missing values, are left unchanged.
+
+    Notes:
+        Each distinct string is normalized once and mapped back onto the
+        column, so repeated category values cost a single lookup. For a
+        ``category`` Series only the categories are normalized; categories
+        that normalize to the same text are merged.
+    """
+
+    def normalize_value(value: object) -> object:
+        if isinstance(value, str):
+            return common.str_normalize(value, lower, valid_chars, engine)
+        return value
+
+    if series.dtype == "category":
+        categories = series.cat.categories
+        normalized_categories = categories.map(normalize_value)
+        if normalized_categories.is_unique:
+            return series.cat.rename_categories(normalized_categories)
+        return series.map(dict(zip(categories, normalized_categories))).astype("category")
+
+    normalized_values = {
+        value: normalize_value(value)
+        for value in series.unique()
+        if isinstance(value, str)
+    }
+    return series.map(
+        lambda value: normalized_values[value] if isinstance(value, str) else value
+    )
 
 
 def excel_safe_append(
@@ -173,17 +424,300 @@ def excel_safe_append(
         file_path (str): Destination Excel workbook path.
         sheet_name (str): Target sheet name.
         data_frame (pd.DataFrame): Data to write into the sheet.
+
+    Notes:
+        New workbooks are written with the streaming xlsxwriter engine when it
+        is installed. Existing workbooks are always updated through openpyxl,
+        the only pandas engine that can append to a file.
     """
 
     pd = _import_pandas()
     file_exists = os.path.exists(file_path)
-    write_mode = "a" if file_exists else "w"
-    sheet_settings = {"if_sheet_exists": "replace"} if file_exists else {}
+    if file_exists:
+        writer_settings = {
+            "engine": "openpyxl",
+            "mode": "a",
+            "if_sheet_exists": "replace",
+        }
+    else:
+        new_file_engine = "xlsxwriter" if common.is_lib_installed("xlsxwriter") else "openpyxl"
+        writer_settings = {"engine": new_file_engine, "mode": "w"}
 
-    with pd.ExcelWriter(
-        file_path,
-        engine="openpyxl",
-        mode=write_mode,
-        **sheet_settings,
-    ) as writer:
+    with pd.ExcelWriter(file_path, **writer_settings) as writer:
         data_frame.to_excel(writer, sheet_name=sheet_name, index=True)
+
+
+#%% === Internal Tools ===
+def _read_data_frame(
+    file_path: str,
+    suffix: str,
+    tab_name: str | None,
+    header: int | None,
+    index_col: int | bool | None,
+    fast_csv: bool,
+    kwargs: dict[str, Any],
+) -> pd.DataFrame:
+    """
+    Read one validated CSV or Excel file into a DataFrame.
+
+    Args:
+        file_path (str): Validated spreadsheet path.
+        suffix (str): Lowercase file extension.
+        tab_name (str | None): Excel sheet name when reading Excel files.
+        header (int | None): Header row setting.
+        index_col (int | bool | None): Index column setting.
+        fast_csv (bool): Whether CSV files may use the pyarrow engine.
+        kwargs (dict[str, Any]): Additional pandas keyword arguments.
+
+    Returns:
+        pd.DataFrame: Loaded spreadsheet data.
+    """
+
+    pd = _import_pandas()
+
+    if suffix in VAR["extension_sets"]["csv"]:
+        default_kwargs = dict(kwargs)
+        arrow_index_col = _resolve_csv_engine(index_col, kwargs) if fast_csv else index_col
+        if kwargs.get("engine") == "pyarrow" and "engine" not in default_kwargs:
+            try:
+                return pd.read_csv(
+                    file_path,
+                    header=header,
+                    index_col=arrow_index_col,
+                    **kwargs,
+                )
+            except ValueError:
+                # pyarrow rejects some options and malformed rows the C parser accepts.
+                pass
+
+        return pd.read_csv(
+            file_path,
+            header=header,
+            index_col=index_col,
+            **default_kwargs,
+        )
+
+    if suffix in VAR["extension_sets"]["excel"]:
+        _resolve_excel_engine(pd, kwargs)
+        return pd.read_excel(
+            file_path,
+            sheet_name=0 if tab_name is None else tab_name,
+            header=header,
+            index_col=index_col,
+            **kwargs,
+        )
+
+    raise ValueError(f"Unsupported spreadsheet extension: {suffix}")
+
+
+def _read_data_frame_with_cache(
+    file_path: str,
+    suffix: str,
+    tab_name: str | None,
+    header: int | None,
+    index_col: int | bool | None,
+    fast_csv: bool,
+    kwargs: dict[str, Any],
+) -> pd.DataFrame:
+    """
+    Read one spreadsheet through the DataFrame cache when its settings hash.
+
+    Args:
+        file_path (str): Validated spreadsheet path.
+        suffix (str): Lowercase file extension.
+        tab_name (str | None): Excel sheet name when reading Excel files.
+        header (int | None): Header row setting.
+        index_col (int | bool | None): Index column setting.
+        fast_csv (bool): Whether CSV files may use the pyarrow engine.
+        kwargs (dict[str, Any]): Additional pandas keyword arguments.
+
+    Returns:
+        pd.DataFrame: Cached DataFrame, shared between calls.
+    """
+
+    file_stat = os.stat(file_path)
+    cache_key = (
+        file_path,
+        file_stat.st_mtime_ns,
+        file_stat.st_size,
+        suffix,
+        tab_name,
+        header,
+        index_col,
+        fast_csv,
+        tuple(sorted(kwargs.items())),
+    )
+    try:
+        hash(cache_key)
+    except TypeError:
+        # Unhashable reader settings such as a usecols list are read uncached.
+        return _read_data_frame(file_path, suffix, tab_name, header, index_col, fast_csv, kwargs)
+
+    return _read_cached_data_frame(*cache_key)
+
+
+@lru_cache(maxsize=VAR["spreadsheet_cache_size"])
+def _read_cached_data_frame(
+    file_path: str,
+    mtime_ns: int,
+    file_size: int,
+    suffix: str,
+    tab_name: str | None,
+    header: int | None,
+    index_col: int | bool | None,
+    fast_csv: bool,
+    kwargs_items: tuple[tuple[str, Any], ...],
+) -> pd.DataFrame:
+    """
+    Memoize one DataFrame read per file version and read settings.
+
+    Args:
+        file_path (str): Validated spreadsheet path.
+        mtime_ns (int): File modification time, part of the cache key.
+        file_size (int): File size in bytes, part of the cache key.
+        suffix (str): Lowercase file extension.
+        tab_name (str | None): Excel sheet name when reading Excel files.
+        header (int | None): Header row setting.
+        index_col (int | bool | None): Index column setting.
+        fast_csv (bool): Whether CSV files may use the pyarrow engine.
+        kwargs_items (tuple[tuple[str, Any], ...]): Sorted pandas keywords.
+
+    Returns:
+        pd.DataFrame: Loaded spreadsheet data.
+    """
+
+    return _read_data_frame(
+        file_path,
+        suffix,
+        tab_name,
+        header,
+        index_col,
+        fast_csv,
+        dict(kwargs_items),
+    )
+
+
+def _merge_chunk_dicts(pandas_module: Any, chunks: Iterator[pd.DataFrame], orient: str) -> dict | list:
+    """
+    Convert CSV chunks to one ``to_dict`` result without concatenating them.
+
+    Args:
+        pandas_module (Any): Imported pandas module.
+        chunks (Iterator[pd.DataFrame]): Chunks yielded by ``pd.read_csv``.
+        orient (str): ``DataFrame.to_dict`` orientation.
+
+    Returns:
+        dict | list: Data equivalent to ``to_dict`` on the full DataFrame.
+    """
+
+    if orient == "index":
+        merged_rows: dict = {}
+        for chunk in chunks:
+            merged_rows.update(chunk.to_dict(orient="index"))
+        return merged_rows
+
+    if orient == "records":
+        merged_records: list = []
+        for chunk in chunks:
+            merged_records.extend(chunk.to_dict(orient="records"))
+        return merged_records
+
+    if orient in {"dict", "list"}:
+        merged_columns: dict = {}
+        for chunk in chunks:
+            for column_name, values in chunk.to_dict(orient=orient).items():
+                if column_name not in merged_columns:
+                    merged_columns[column_name] = values
+                elif orient == "dict":
+                    merged_columns[column_name].update(values)
+                else:
+                    merged_columns[column_name].extend(values)
+        return merged_columns
+
+    return pandas_module.concat(chunks).to_dict(orient=orient)
+
+
+def _iter_xlsx_rows(
+    file_path: str,
+    tab_name: str | None,
+) -> Iterator[dict[str, Any]]:
+    """
+    Stream ``.xlsx`` data rows through openpyxl's read-only mode.
+
+    Args:
+        file_path (str): Validated workbook path.
+        tab_name (str | None): Sheet name, or ``None`` for the first sheet.
+
+    Yields:
+        dict[str, Any]: One data row keyed by the first-row header labels.
+        Cells to the right of the last label get ``Unnamed: N`` keys from
+        the first row that reaches them onwards.
+    """
+
+    openpyxl = common.import_lib("openpyxl", silent=False)
+    workbook = openpyxl.load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        worksheet = workbook.worksheets[0] if tab_name is None else workbook[tab_name]
+        worksheet.reset_dimensions()
+        rows = worksheet.iter_rows(values_only=True)
+        header = next(rows, None)
+        if header is None:
+            return
+
+        column_names = _deduplicate_headers(header)
+        column_count = len(column_names)
+        na_values = VAR["na_values"]
+        pending_blank_rows = 0
+        for row in rows:
+            if all(value is None for value in row):
+                # Held back so trailing blank rows are dropped like pandas does.
+                pending_blank_rows += 1
+                continue
+            for _ in range(pending_blank_rows):
+                yield dict.fromkeys(column_names)
+            pending_blank_rows = 0
+
+            row_width = len(row)
+            while row[row_width - 1] is None:
+                row_width -= 1
+            if row_width > column_count:
+                # pandas labels cells past the header instead of dropping them.
+                column_names = _deduplicate_headers(
+                    tuple(header) + (None,) * (row_width - len(header))
+                )
+                column_count = len(column_names)
+
+            values = [
+                None if isinstance(value, str) and value in na_values else value
+                for value in row[:column_count]
+            ]
+            values.extend([None] * (column_count - len(values)))
+            yield dict(zip(column_names, values))
+    finally:
+        workbook.close()
+
+
+def _deduplicate_headers(header: Sequence[object]) -> list[str]:
+    """
+    Return unique header labels for one streamed spreadsheet.
+
+    Args:
+        header (Sequence[object]): Raw first-row labels.
+
+    Returns:
+        list[str]: Labels with blanks and duplicates renamed.
+    """
+
+    column_names: list[str] = []
+    seen_names: set[str] = set()
+    for index, name in enumerate(header):
+        name = "" if name is None else str(name)
+        column_name = name if name.strip() else f"Unnamed: {index}"
+        candidate_name = column_name
+        suffix_index = 1
+        while candidate_name in seen_names:
+            candidate_name = f"{column_name}.{suffix_index}"
+            suffix_index += 1
+        seen_names.add(candidate_name)
+        column_names.append(candidate_name)
+    return column_names
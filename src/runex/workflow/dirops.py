@@ -22,8 +22,11 @@ __all__ = [
 import os
 import re
 import shutil
+import unicodedata
 
 from typing import Any
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 
 # Insternal
 from ..ops import ask, lprint
@@ -49,6 +52,7 @@ def global_variables() -> dict[str, Any]:
             "cp": "Copying",
             "mv": "Moving",
         },
+        "max_copy_workers": min(32, (os.cpu_count() or 1) * 4),
     }
 
 
@@ -151,7 +155,11 @@ def run_delete(
         ops_dirops.delete_paths(targets, force=force)
 
 
-def run_copy(dir_dict: DirectoryPlan, override: bool | None = None) -> None:
+def run_copy(
+    dir_dict: DirectoryPlan,
+    override: bool | None = None,
+    parallel: bool = True,
+) -> None:
     """
     Copy files or directory trees from a workflow plan.
 
@@ -159,12 +167,19 @@ def run_copy(dir_dict: DirectoryPlan, override: bool | None = None) -> None:
         dir_dict (DirectoryPlan): Workflow plan containing source and
             destination rows.
         override (bool | None): Overwrite behavior.
+        parallel (bool): Copy the files of a directory tree with a thread
+            pool. Pass ``False`` for strictly serial I/O, for example on
+            spinning disks.
     """
 
-    _run_copy_or_move("cp", dir_dict, override)
+    _run_copy_or_move("cp", dir_dict, override, parallel=parallel)
 
 
-def run_move(dir_dict: DirectoryPlan, override: bool | None = None) -> None:
+def run_move(
+    dir_dict: DirectoryPlan,
+    override: bool | None = None,
+    parallel: bool = True,
+) -> None:
     """
     Move files or directory trees from a workflow plan.
 
@@ -172,9 +187,11 @@ def run_move(dir_dict: DirectoryPlan, override: bool | None = None) -> None:
         dir_dict (DirectoryPlan): Workflow plan containing source and
             destination rows.
         override (bool | None): Overwrite behavior.
+        parallel (bool): Move the files of a directory tree with a thread
+            pool. Pass ``False`` for strictly serial I/O.
     """
 
-    _run_copy_or_move("mv", dir_dict, override)
+    _run_copy_or_move("mv", dir_dict, override, parallel=parallel)
 
 
 def run_rename(dir_dict: DirectoryPlan) -> None:
@@ -213,26 +230,8 @@ def run_unpack(
     overwrite = _resolve_override(override)
 
     for row in dir_list:
-        src = ops_dirops.fix_path(row[0])
-        dst = ops_dirops.fix_path(row[1]) if len(row) == 2 else None
-
-        if not os.path.exists(src):
-            lprint.error(f"Directory does not exist.\n{src}\nSkipping task...")
-            continue
-
-        valid_format, _ = ops_dirops.detect_unpack_format(src)
-        if not valid_format:
-            lprint.error(f"Format not supported.\n{src}\nSkipping task...")
-            continue
-
-        try:
-            unpacked = ops_dirops.unpack_archive(src, dst, override=overwrite)
-        except shutil.ReadError:
-            lprint.error(f"Unable to unpack\n     {src}\nSkipping task")
-            continue
-
-        if not unpacked:
-            print(f"Skipping existing destination for archive: {src}")
+        dst = row[1] if len(row) == 2 else None
+        _unpack_one(row[0], dst, overwrite)
 
 
 def run_unpack_all_in_folder(
@@ -245,7 +244,8 @@ def run_unpack_all_in_folder(
 
     Args:
         dir_list (list[str]): Folder paths to scan for archives.
-        recursive (bool): Keep rescanning until no new archives remain.
+        recursive (bool): Also scan each newly extracted folder for nested
+            archives until none remain.
         override (bool | None): Overwrite behavior.
     """
 
@@ -261,51 +261,74 @@ def run_unpack_all_in_folder(
         )
 
         count = 0
-        processed_files = set()
+        processed_files: set[str] = set()
+        pending_folders = deque([normalized_src])
 
-        def scan_once() -> bool:
-            """
-            Scan one folder pass and unpack any newly discovered archives.
+        while pending_folders:
+            archives = [
+                entry.path
+                for _, _, file_entries in ops_dirops.scan_tree(pending_folders.popleft())
+                for entry in file_entries
+                if entry.path not in processed_files
+                and ops_dirops.detect_unpack_format(entry.path)[0]
+            ]
 
-            Returns:
-                bool: Whether at least one archive was unpacked.
-            """
+            for file_path in archives:
+                processed_files.add(file_path)
+                count += 1
+                print(f"Unpacking {count:02}:\t{file_path}")
+                destination = _unpack_one(file_path, None, overwrite)
+                print("|-> DONE\n")
 
-            nonlocal count
-            changed = False
+                if recursive and destination is not None:
+                    pending_folders.append(destination)
 
-            for dirpath, _, filenames in os.walk(normalized_src):
-                for filename in filenames:
-                    file_path = os.path.join(dirpath, filename)
-                    if file_path in processed_files:
-                        continue
 
-                    valid, _ = ops_dirops.detect_unpack_format(file_path)
-                    if not valid:
-                        continue
+#%% === Internal Tools ===
+def _unpack_one(src: str, dst: str | None, override: bool) -> str | None:
+    """
+    Unpack one archive and report skipped or failed tasks.
 
-                    count += 1
-                    print(f"Unpacking {count:02}:\t{file_path}")
-                    run_unpack([[file_path]], override=overwrite)
-                    print("|-> DONE\n")
+    Args:
+        src (str): Archive file path.
+        dst (str | None): Optional destination directory.
+        override (bool): Whether an existing destination may be replaced.
 
-                    processed_files.add(file_path)
-                    changed = True
+    Returns:
+        str | None: Destination directory when the archive was unpacked,
+        otherwise ``None``.
+    """
 
-            return changed
+    src = ops_dirops.fix_path(src)
+    dst = ops_dirops.fix_path(dst) if dst is not None else None
 
-        if recursive:
-            while scan_once():
-                pass
-        else:
-            scan_once()
+    if not os.path.exists(src):
+        lprint.error(f"Directory does not exist.\n{src}\nSkipping task...")
+        return None
+
+    valid_format, extension = ops_dirops.detect_unpack_format(src)
+    if not valid_format:
+        lprint.error(f"Format not supported.\n{src}\nSkipping task...")
+        return None
+
+    try:
+        unpacked = ops_dirops.unpack_archive(src, dst, override=override)
+    except shutil.ReadError:
+        lprint.error(f"Unable to unpack\n     {src}\nSkipping task")
+        return None
+
+    if not unpacked:
+        print(f"Skipping existing destination for archive: {src}")
+        return None
+
+    return src.removesuffix(extension) if dst is None else dst
 
 
-#%% === Internal Tools ===
 def _run_copy_or_move(
     option: str,
     dir_dict: DirectoryPlan,
     override: bool | None = None,
+    parallel: bool = True,
 ) -> None:
     """
     Execute a copy or move workflow plan.
@@ -314,6 +337,7 @@ def _run_copy_or_move(
         option (str): Copy or move selector, either ``"cp"`` or ``"mv"``.
         dir_dict (DirectoryPlan): Workflow plan to execute.
         override (bool | None): Overwrite behavior.
+        parallel (bool): Run directory-tree file operations in a thread pool.
     """
 
     overwrite = _resolve_override(override)
@@ -350,6 +374,7 @@ def _run_copy_or_move(
                 onlyfiles=onlyfiles,
                 ignorefiles=ignorefiles,
                 override=overwrite,
+                parallel=parallel,
             )
             continue
 
@@ -364,6 +389,7 @@ def _copy_or_move_directory_tree(
     onlyfiles: str | None,
     ignorefiles: str | None,
     override: bool,
+    parallel: bool = True,
 ) -> None:
     """
     Copy or move all matching files from one directory tree to another.
@@ -375,33 +401,95 @@ def _copy_or_move_directory_tree(
         onlyfiles (str | None): Optional include regex.
         ignorefiles (str | None): Optional exclude regex.
         override (bool): Overwrite behavior.
+        parallel (bool): Run the file operations in a thread pool.
     """
 
-    for root, _, files in os.walk(src):
-        if not onlyfiles and not ignorefiles:
-            rel_root = os.path.relpath(root, src)
-            dst_root = os.path.join(dst, rel_root)
-            os.makedirs(dst_root, exist_ok=True)
-
-        for file_name in files:
-            rel_path = os.path.relpath(os.path.join(root, file_name), src)
-            if onlyfiles and not re.search(onlyfiles, file_name):
-                continue
-            if ignorefiles and re.search(ignorefiles, file_name):
+    include_pattern = re.compile(onlyfiles) if onlyfiles else None
+    exclude_pattern = re.compile(ignorefiles) if ignorefiles else None
+    needed_dirs: set[str] = set()
+    file_tasks: list[tuple[str, str]] = []
+
+    for root, _, file_entries in ops_dirops.scan_tree(src):
+        rel_root = os.path.relpath(root, src)
+        dst_root = dst if rel_root == os.curdir else os.path.join(dst, rel_root)
+        if include_pattern is None and exclude_pattern is None:
+            needed_dirs.add(dst_root)
+
+        existing_names: set[str] | None = None
+        folded_names: set[str] = set()
+        for entry in file_entries:
+            if (
+                (include_pattern is not None and not include_pattern.search(entry.name))
+                or (exclude_pattern is not None and exclude_pattern.search(entry.name))
+            ):
                 continue
 
-            src_path = os.path.join(root, file_name)
-            dst_path = os.path.join(dst, rel_path)
+            if not override:
+                if existing_names is None:
+                    existing_names = _list_entry_names(dst_root)
+                    folded_names = {_fold_entry_name(name) for name in existing_names}
+                if entry.name in existing_names:
+                    continue
+                # Case-insensitive filesystems treat Report.TXT and report.txt
+                # as one file, so confirm near matches with a stat.
+                if _fold_entry_name(entry.name) in folded_names and os.path.exists(
+                    os.path.join(dst_root, entry.name)
+                ):
+                    continue
 
-            if not override and os.path.exists(dst_path):
-                continue
-            _dispatch_copy_or_move(option, src_path, dst_path)
+            needed_dirs.add(dst_root)
+            file_tasks.append((entry.path, os.path.join(dst_root, entry.name)))
+
+    for directory in sorted(needed_dirs):
+        os.makedirs(directory, exist_ok=True)
+
+    _run_file_tasks(option, file_tasks, parallel=parallel)
 
     if option == "mv":
         _remove_empty_directories(src)
 
 
-def _dispatch_copy_or_move(option: str, src: str, dst: str) -> None:
+def _run_file_tasks(
+    option: str,
+    file_tasks: list[tuple[str, str]],
+    parallel: bool = True,
+) -> None:
+    """
+    Run collected copy or move operations, optionally in a thread pool.
+
+    Args:
+        option (str): Copy or move selector.
+        file_tasks (list[tuple[str, str]]): Source and destination file pairs
+            whose destination directories already exist.
+        parallel (bool): Use a thread pool when ``True``.
+
+    Raises:
+        OSError: Re-raised from the first failed operation in task order,
+            after every submitted operation has finished.
+    """
+
+    if not parallel or len(file_tasks) < 2:
+        for src_path, dst_path in file_tasks:
+            _dispatch_copy_or_move(option, src_path, dst_path, make_parents=False)
+        return
+
+    max_workers = min(VAR["max_copy_workers"], len(file_tasks))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [
+            executor.submit(_dispatch_copy_or_move, option, src_path, dst_path, False)
+            for src_path, dst_path in file_tasks
+        ]
+
+    for future in futures:
+        future.result()
+
+
+def _dispatch_copy_or_move(
+    option: str,
+    src: str,
+    dst: str,
+    make_parents: bool = True,
+) -> None:
     """
     Dispatch one copy or move operation to the ops layer.
 
@@ -409,13 +497,15 @@ def _dispatch_copy_or_move(option: str, src: str, dst: str) -> None:
         option (str): Copy or move selector.
         src (str): Source path.
         dst (str): Destination path.
+        make_parents (bool): Whether the ops layer should create the
+            destination parent directory.
     """
 
     if option == "cp":
-        ops_dirops.copy_path(src, dst)
+        ops_dirops.copy_path(src, dst, make_parents=make_parents)
         return
     if option == "mv":
-        ops_dirops.move_path(src, dst)
+        ops_dirops.move_path(src, dst, make_parents=make_parents)
         return
     raise ValueError(f"Unsupported workflow option: {option}")
 
@@ -441,6 +531,38 @@ def _remove_empty_directories(path: str) -> None:
         os.rmdir(path)
 
 
+def _list_entry_names(path: str) -> set[str]:
+    """
+    Return the entry names present in one directory.
+
+    Args:
+        path (str): Directory to list.
+
+    Returns:
+        set[str]: Entry names, or an empty set when the directory is missing.
+    """
+
+    try:
+        with os.scandir(path) as iterator:
+            return {entry.name for entry in iterator}
+    except OSError:
+        return set()
+
+
+def _fold_entry_name(name: str) -> str:
+    """
+    Return a case- and normalization-insensitive key for one entry name.
+
+    Args:
+        name (str): File or directory name.
+
+    Returns:
+        str: NFC-normalized, casefolded name.
+    """
+
+    return unicodedata.normalize("NFC", name).casefold()
+
+
 def _get_directory_info(
     item: DirectoryPlanRow,
 ) -> tuple[str, str, str | None, str | None]: